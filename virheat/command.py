@@ -123,6 +123,19 @@ def get_args(sysargs):
         default=20,
         help="display mutations covered at least x time (only if per base cov tsv files are provided)"
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        metavar="1",
+        default=1,
+        help="number of processes to parse the vcf files in parallel (only faster for many or large vcf files)"
+    )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="cache the parsed vcf files in $XDG_CACHE_HOME/virheat (default: ~/.cache/virheat) to speed up re-runs on the same files (renewed if a file or the virheat version changes, never cleaned up: delete the folder to clear it)"
+    )
     parser.add_argument(
         "-s", "--scores",
         metavar=('scores_file', 'pos_col', 'score_col', 'score_name'),
@@ -162,25 +175,25 @@ def main(sysargs=sys.argv[1:]):
         sys.exit("\033[31m\033[1mERROR:\033[0m No VCF files provided")
     else:
         if args.scores:
-            frequency_lists, unique_mutations, file_names = data_prep.extract_vcf_data(vcf_files, args.reference, threshold=args.threshold, scores=True)
+            frequency_lists, unique_mutations, positions, file_names = data_prep.extract_vcf_data(vcf_files, args.reference, threshold=args.threshold, scores=True, cache=args.cache, threads=args.threads)
             n_scores = len(args.scores)
         else:
-            frequency_lists, unique_mutations, file_names = data_prep.extract_vcf_data(vcf_files, args.reference, threshold=args.threshold)
+            frequency_lists, unique_mutations, positions, file_names = data_prep.extract_vcf_data(vcf_files, args.reference, threshold=args.threshold, cache=args.cache, threads=args.threads)
 
     if args.zoom:
-        unique_mutations = data_prep.zoom_to_genomic_regions(unique_mutations, args.zoom)
+        unique_mutations, positions = data_prep.zoom_to_genomic_regions(unique_mutations, positions, args.zoom)
     frequency_array = data_prep.create_freq_array(unique_mutations, frequency_lists)
 
     # enables the deletion option only if more than 1 vcf file is provided
     if len(vcf_files) > 1:
         # user specified delete options (removes mutations based on various rationales)
         if args.delete:
-            frequency_array = data_prep.delete_common_mutations(frequency_array, unique_mutations)
+            frequency_array = data_prep.delete_common_mutations(frequency_array, unique_mutations, positions)
         if args.delete_n is not None:
-            frequency_array = data_prep.delete_n_mutations(frequency_array, unique_mutations, args.delete_n)
+            frequency_array = data_prep.delete_n_mutations(frequency_array, unique_mutations, positions, args.delete_n)
 
     # annotate low coverage if per base coverage from qualimap was provided
-    data_prep.annotate_non_covered_regions(args.input[0], args.min_cov, frequency_array, file_names, unique_mutations, args.reference)
+    data_prep.annotate_non_covered_regions(args.input[0], args.min_cov, frequency_array, file_names, positions, args.reference)
 
     # define relative locations of all items in the plot
     n_samples, n_mutations = len(frequency_array), len(frequency_array[0])
@@ -197,7 +210,7 @@ def main(sysargs=sys.argv[1:]):
     elif args.gff3_path is not None:
         gff3_info = data_prep.parse_gff3(args.gff3_path, args.reference)
         genome_end = data_prep.get_genome_end(gff3_info)
-        genes_with_mutations, n_tracks = data_prep.create_track_dict(unique_mutations, gff3_info, args.gff3_annotations)
+        genes_with_mutations, n_tracks = data_prep.create_track_dict(positions, gff3_info, args.gff3_annotations)
     elif args.genome_length is not None:
         genome_end = args.genome_length
         n_tracks = 0
@@ -5,6 +5,11 @@ contains all data prep functions of virHEAT
 # BUILT-INS
 import os
 import re
+import pickle
+import hashlib
+import tempfile
+import functools
+import concurrent.futures
 import pathlib
 import sys
 
@@ -12,6 +17,15 @@ import sys
 import numpy as np
 import pandas as pd
 
+# virHEAT
+from virheat import __version__
+
+# compiled once as it is applied to every file name when sorting
+DIGIT_REGEX = re.compile(r'\d+')
+# location of the parsed vcf files if caching is enabled, the files are never
+# removed by virheat (delete the folder to clear the cache)
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "virheat")
+
 
 def get_files(path, type):
     """
@@ -24,10 +38,10 @@ def get_digit_and_alpha(filename):
     """
     get digits and alpha in file names
     """
-    digit_match = re.search(r'\d+', filename)
+    digit_match = DIGIT_REGEX.search(filename)
     if digit_match:
         digit = digit_match.group()
-        alpha = re.sub(r'\d+', '', filename)
+        alpha = DIGIT_REGEX.sub('', filename)
     else:
         digit = ''
         alpha = filename
@@ -38,13 +52,17 @@ def convert_string(string):
     """
     converts string to its right type
     """
-    string = string.replace("\n", "")
-    if string.isdecimal():
-        return(int(string))
-    elif string.replace('.', '', 1).isdecimal():
-        return(float(string))
-    else:
+    # only parse what starts like a number (a digit after an optional '-' or '.'),
+    # otherwise e.g. 'NAN' or '-inf' would be converted by float()
+    if not string.lstrip('-.')[:1].isdigit() or "_" in string:
         return string
+    try:
+        return int(string)
+    except ValueError:
+        try:
+            return float(string)
+        except ValueError:
+            return string
 
 
 def read_vcf(vcf_file, reference):
@@ -52,129 +70,198 @@ def read_vcf(vcf_file, reference):
     parse vcf files to dictionary
     """
     vcf_dict = {}
+    n_variants = 0
 
-    # get header and values
-    with open(vcf_file, "r") as f:
-        header_lines = [l.strip().split("\t") for l in f if l.startswith('#CHROM')]
-        if not header_lines:
+    with open(vcf_file, "r", buffering=1 << 20) as f:
+        # get header (the file iterator is consumed up to the '#CHROM' line)
+        for l in f:
+            if l.startswith('#CHROM'):
+                header = l.strip().split("\t")
+                break
+        else:
             print(f"\033[31m\033[1mWARNING:\033[0m {vcf_file} does not contain a '#CHROM' header!")
             return {}
-        header = header_lines[0]
-    # get each line as frequency_lists
-    with open(vcf_file, "r") as f:
-        lines = [l.strip().split("\t") for l in f if l.startswith(reference)]
+        # get standard headers as keys
+        for key in header[0:6]:
+            vcf_dict[key] = []
+        # functional effect
+        vcf_dict["MUT_TYPE_"] = []
+        # lazily get each remaining line of the reference, only INFO and the
+        # fields before it are split
+        lines = (l.strip().split("\t", 8) for l in f if l.startswith(reference))
+        # lists of the standard headers (bound once instead of a lookup per value)
+        standard_columns = [vcf_dict[key] for key in header[0:6]]
+        mut_types = vcf_dict["MUT_TYPE_"]
+        # number of variants up to which each INFO column is filled, the
+        # none values of lines without the key are only appended when needed
+        info_filled = {}
+        # fill in dictionary
+        for line in lines:
+            # check if there are multiple called variants at a single position
+            # separated by a comma
+            length_variants = line[4].count(',') + 1
+            for field, column in zip(line, standard_columns):
+                # same value for all variants -> convert only once
+                if ',' not in field:
+                    column.extend([convert_string(field)]*length_variants)
+                    continue
+                sublines = field.split(',')
+                for i in range(length_variants):
+                    if i < len(sublines):
+                        column.append(convert_string(sublines[i]))
+                    else:
+                        column.append(convert_string(sublines[0]))
+            # get mutation type
+            ref_length = len(line[3])
+            mut_types.extend(
+                ["SNV" if len(mutation) == ref_length else "INS" if len(mutation) > ref_length else "DEL"
+                 for mutation in line[4].split(',')]
+            )
+            # get data from info field
+            for info in line[7].split(";"):
+                if "=" in info:
+                    key, val = info.split("=")
+                    column = vcf_dict.get(key)
+                    if column is None:
+                        column = vcf_dict[key] = []
+                        info_filled[key] = 0
+                    # fill up with none for the prior lines without this key
+                    if key in info_filled:
+                        column.extend([None]*(n_variants - info_filled[key]))
+                        info_filled[key] = n_variants + length_variants
+                    if ',' not in val:
+                        column.append(convert_string(val))
+                    else:
+                        column.extend([convert_string(value) for value in val.split(',')])
+            n_variants += length_variants
+        # append none for the remaining lines without the INFO key
+        for key, filled in info_filled.items():
+            vcf_dict[key].extend([None]*(n_variants - filled))
     # check if vcf is empty
-    if not lines:
+    if not n_variants:
         print(f"\033[31m\033[1mWARNING:\033[0m {vcf_file} has no variants to {reference}!")
-    # get standard headers as keys
-    for key in header[0:6]:
-        vcf_dict[key] = []
-    # functional effect
-    vcf_dict["MUT_TYPE_"] = []
-    # info field
-    for line in lines:
-        for info in line[7].split(";"):
-            if "=" in info:
-                vcf_dict[info.split("=")[0]] = []
-    # fill in dictionary
-    for line in lines:
-        # remember keys that have an entry already
-        visited_keys = []
-        # check if there are multiple called variants at a single position
-        # separated by a comma
-        length_variants = len(line[4].split(','))
-        for idx, key in enumerate(header[0:6]):
-            sublines = line[idx].split(',')
-            for i in range(length_variants):
-                try:
-                    vcf_dict[key].append(convert_string(sublines[i]))
-                except IndexError:
-                    vcf_dict[key].append(convert_string(sublines[0]))
-        # get mutation type
-        mutations = line[4].split(',')
-        for mutation in mutations:
-            if len(line[3]) == len(mutation):
-                vcf_dict["MUT_TYPE_"].append("SNV")
-            elif len(line[3]) < len(mutation):
-                vcf_dict["MUT_TYPE_"].append("INS")
-            elif len(line[3]) > len(mutation):
-                vcf_dict["MUT_TYPE_"].append("DEL")
-        visited_keys.extend(header[0:6])
-        visited_keys.append("MUT_TYPE_")
-        # get data from info field
-        for info in line[7].split(";"):
-            if "=" in info:
-                key, val = info.split("=")
-                val_list = val.split(',')
-                for value in val_list:
-                    vcf_dict[key].append(convert_string(value))
-                visited_keys.append(key)
-        # append none for each none visited key in the INFO field
-        for key in [k for k in vcf_dict.keys() if k not in visited_keys]:
-            vcf_dict[key].extend([None]*length_variants)
 
     return vcf_dict
 
 
-def extract_vcf_data(vcf_files, reference, threshold=0, scores=False):
+def read_vcf_cached(vcf_file, reference, cache_dir=CACHE_DIR):
     """
-    extract relevant vcf data
+    parse vcf files to dictionary and reuse the result of a prior run if
+    the file (path, mtime, size) and the reference did not change. Changes
+    of the parser are only detected by the virheat version, results of
+    unreleased changes to read_vcf are therefore not renewed.
     """
+    stat = os.stat(vcf_file)
+    key = f"{os.path.abspath(vcf_file)}\t{stat.st_mtime_ns}\t{stat.st_size}\t{reference}\t{__version__}"
+    cache_file = os.path.join(cache_dir, f"{hashlib.sha1(key.encode()).hexdigest()}.pickle")
+
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "rb") as f:
+                vcf_dict = pickle.load(f)
+            # same warnings as when parsing the file
+            if not vcf_dict:
+                print(f"\033[31m\033[1mWARNING:\033[0m {vcf_file} does not contain a '#CHROM' header!")
+            elif not vcf_dict["#CHROM"]:
+                print(f"\033[31m\033[1mWARNING:\033[0m {vcf_file} has no variants to {reference}!")
+            return vcf_dict
+        # a damaged or foreign pickle can raise nearly anything on load
+        except Exception:
+            print(f"\033[31m\033[1mWARNING:\033[0m cache of {vcf_file} is not readable and is rebuilt.")
+    vcf_dict = read_vcf(vcf_file, reference)
+    # write to a temporary file first as several processes might write at the same time
+    tmp_file = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=cache_dir, delete=False) as f:
+            tmp_file = f.name
+            pickle.dump(vcf_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        # the cache is only an optimization -> continue with the parsed file
+        print(f"\033[31m\033[1mWARNING:\033[0m {vcf_file} could not be cached in {cache_dir} ({e}).")
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.unlink(tmp_file)
 
-    file_names = []
-    frequency_lists = []
+    return vcf_dict
 
-    for file in vcf_files:
-        file_names.append(os.path.splitext(os.path.basename(file))[0])
-        vcf_dict = read_vcf(file, reference)
-        frequency_list = []
-        # write all mutation info in a '_' sep string
-        for idx in range(0, len(vcf_dict["#CHROM"])):
-            if not vcf_dict["AF"][idx] >= threshold:
-                continue
-            if scores:
-                if vcf_dict['EFF'][idx] is not None:
-                    aa_change = vcf_dict['EFF'][idx].split('|')[3]  # extract amino acid changes if provided
-                else:
-                    aa_change = '-'
-                frequency_list.append(
-                    (f"{vcf_dict['POS'][idx]}_{vcf_dict['REF'][idx]}_{vcf_dict['ALT'][idx]}_{vcf_dict['MUT_TYPE_'][idx]}_{aa_change}", vcf_dict['AF'][idx])
-                )
-            else:
-                frequency_list.append(
-                    (f"{vcf_dict['POS'][idx]}_{vcf_dict['REF'][idx]}_{vcf_dict['ALT'][idx]}_{vcf_dict['MUT_TYPE_'][idx]}", vcf_dict['AF'][idx])
-                )
 
-        frequency_lists.append(frequency_list)
+def extract_frequency_list(vcf_file, reference, threshold=0, scores=False, cache=False):
+    """
+    extract the mutations and their frequencies of a single vcf file
+    """
+
+    if cache:
+        vcf_dict = read_vcf_cached(vcf_file, reference)
+    else:
+        vcf_dict = read_vcf(vcf_file, reference)
+    n_variants = len(vcf_dict["#CHROM"])
+    frequencies = np.array(vcf_dict.get("AF", [None]*n_variants), dtype=object)
+    # select all variants above the threshold at once (missing AF -> nan -> never selected)
+    selected = np.flatnonzero(frequencies.astype(float) >= threshold)
+    columns = [np.array(vcf_dict[key], dtype=object)[selected].tolist() for key in ["POS", "REF", "ALT", "MUT_TYPE_"]]
+    if scores:
+        # extract amino acid changes if provided
+        effects = np.array(vcf_dict.get("EFF", [None]*n_variants), dtype=object)[selected].tolist()
+        columns.append([eff.split('|')[3] if eff is not None else '-' for eff in effects])
+    # write all mutation info in a (pos, ref, alt, mut type) tuple
+    frequency_list = list(zip(zip(*columns), frequencies[selected].tolist()))
+
+    return frequency_list
+
+
+def extract_vcf_data(vcf_files, reference, threshold=0, scores=False, cache=False, threads=1):
+    """
+    extract relevant vcf data
+    """
+
+    file_names = [os.path.splitext(os.path.basename(file))[0] for file in vcf_files]
+    extract = functools.partial(extract_frequency_list, reference=reference, threshold=threshold, scores=scores, cache=cache)
+
+    # parse the vcf files in parallel if asked for (executor.map keeps the file order),
+    # starting the worker processes only pays off for many or large files
+    n_workers = min(len(vcf_files), threads)
+    if n_workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+            frequency_lists = list(
+                executor.map(extract, vcf_files, chunksize=max(1, len(vcf_files)//(4*n_workers)))
+            )
+    else:
+        frequency_lists = [extract(file) for file in vcf_files]
+    # collect each mutation once per position (dict keeps first seen order)
+    mutations_per_position = {}
+    for frequency_list in frequency_lists:
+        for mutation, af in frequency_list:
+            mutations_per_position.setdefault(mutation[0], {})[mutation] = None
     # sort by mutation index
-    unique_mutations = sorted(
-        {x[0] for li in frequency_lists for x in li}, key=lambda x: int(x.split("_")[0])
-    )
+    unique_mutations = [
+        mutation for position in sorted(mutations_per_position) for mutation in mutations_per_position[position]
+    ]
     if not unique_mutations:
         sys.exit(f"\033[31m\033[1mERROR:\033[0m No variants to {reference} in all vcf files!")
+    # keep the positions alongside for the array operations
+    positions = [mutation[0] for mutation in unique_mutations]
 
-    return frequency_lists, unique_mutations, file_names
+    return frequency_lists, unique_mutations, positions, file_names
 
 
 def extract_scores(unique_mutations, scores_file, aa_pos_col, score_col):
     """
     Extract scores from scores_file which corresponding value from aa_pos_col is equal to unique_aa_mutations
     """
-    scores_df = pd.read_csv(scores_file)
+    scores_df = pd.read_csv(scores_file, usecols=[aa_pos_col, score_col])
 
     # create a dictionary to store the scores for each mutation
-    mutation_scores = {}
-    for idx, row in scores_df.iterrows():
-        mutation_scores[row[aa_pos_col]] = row[score_col]
+    mutation_scores = dict(zip(scores_df[aa_pos_col].tolist(), scores_df[score_col].tolist()))
 
     unique_scores = []
     for mutation in unique_mutations:
-        aa_mut = mutation.split('_')[4]
+        aa_mut = mutation[4]
         if aa_mut in mutation_scores:
             score = mutation_scores[aa_mut]
-            unique_scores.append(f"{mutation}_{score}")
+            unique_scores.append(mutation + (score,))
         else:
-            unique_scores.append(f"{mutation}_nan")
+            unique_scores.append(mutation + (np.nan,))
 
     return unique_scores
 
@@ -184,22 +271,40 @@ def create_freq_array(unique_mutations, frequency_lists):
     create an np array of the mutation frequencies
     """
 
-    frequency_array = []
+    frequency_array = np.zeros((len(frequency_lists), len(unique_mutations)))
+    # column index of each mutation
+    mut_to_col = {mutation: idx for idx, mutation in enumerate(unique_mutations)}
 
-    for frequency_list in frequency_lists:
-        frequencies = []
-        for mutation in unique_mutations:
-            af = [tup[1] for tup in frequency_list if tup[0] == mutation]
-            if af:
-                frequencies.append(af[0])
-            else:
-                frequencies.append(0)
-        frequency_array.append(frequencies)
+    for row, frequency_list in enumerate(frequency_lists):
+        # reversed so that the first entry of a mutation is kept
+        for mutation, af in reversed(frequency_list):
+            col = mut_to_col.get(mutation)
+            # mutation might not be displayed (e.g. zoom)
+            if col is not None:
+                frequency_array[row, col] = af
 
-    return np.array(frequency_array)
+    return frequency_array
 
 
-def annotate_non_covered_regions(coverage_dir, min_coverage, frequency_array, file_names, unique_mutations, reference):
+def get_mutation_coverage(tsv_file, reference, positions):
+    """
+    get the coverage at each mutation position from a per base coverage
+    tsv file (-1 if the position is not in the tsv, nan if the cell is empty)
+    """
+    # coverage as float as empty cells are read as nan
+    chunks = pd.read_csv(
+        tsv_file, sep="\t", usecols=["#chr", "pos", "coverage"],
+        dtype={"#chr": str, "pos": np.int32, "coverage": float}, engine="c", chunksize=1 << 20
+    )
+    # only keep the mutation positions of the reference while reading
+    coverage = pd.concat(chunk[(chunk["#chr"] == reference) & chunk["pos"].isin(positions)] for chunk in chunks)
+    # pos -> coverage lookup
+    coverage = coverage.drop_duplicates("pos").set_index("pos")["coverage"]
+
+    return coverage.reindex(positions, fill_value=-1).to_numpy()
+
+
+def annotate_non_covered_regions(coverage_dir, min_coverage, frequency_array, file_names, positions, reference):
     """
     Insert nan values into np array if position is not covered. Needs
     per base coverage tsv files created by bamqc
@@ -208,78 +313,72 @@ def annotate_non_covered_regions(coverage_dir, min_coverage, frequency_array, fi
     # get tsv files
     per_base_coverage_files = get_files(coverage_dir, "tsv")
     if per_base_coverage_files:
-        for i, (file_name, array) in enumerate(zip(file_names, frequency_array)):
-            if file_name not in [os.path.splitext(os.path.basename(file))[0] for file in per_base_coverage_files]:
+        frequency_array = np.asarray(frequency_array)
+        positions = np.asarray(positions, dtype=np.int32)
+        tsv_files = {os.path.splitext(os.path.basename(file))[0]: file for file in per_base_coverage_files}
+        samples = []
+        for i, file_name in enumerate(file_names):
+            if file_name not in tsv_files:
                 print(f"\033[31m\033[1mWARNING:\033[0m {file_name} was not found in tsv files.")
                 continue
-            tsv_file = [file for file in per_base_coverage_files if os.path.splitext(os.path.basename(file))[0] == file_name][0]
-            coverage = pd.read_csv(tsv_file, sep="\t")
-            coverage = coverage[coverage["#chr"] == reference]
-            for j, (mutation, frequency) in enumerate(zip(unique_mutations, array)):
-                mut_pos = int(mutation.split("_")[0])
-                if coverage[coverage["pos"] == mut_pos].empty or all([frequency == 0, coverage[coverage["pos"] == mut_pos]["coverage"].iloc[0] <= min_coverage]):
-                    frequency_array[i][j] = np.NAN
+            samples.append((i, tsv_files[file_name]))
+        # overlap reading the tsv files in threads (file reads and the C
+        # parser of pandas release the gil), map yields in sample order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(samples), 8) or 1) as executor:
+            coverages = executor.map(
+                functools.partial(get_mutation_coverage, reference=reference, positions=positions),
+                [tsv_file for i, tsv_file in samples]
+            )
+            for (i, tsv_file), mut_cov in zip(samples, coverages):
+                array = frequency_array[i]
+                array[(mut_cov < 0) | ((array == 0) & (mut_cov <= min_coverage))] = np.nan
 
     return np.ma.array(frequency_array, mask=np.isnan(frequency_array))
 
 
-def delete_common_mutations(frequency_array, unique_mutations):
+def delete_common_mutations(frequency_array, unique_mutations, positions):
     """
     delete rows of common mutations (non-zero) that are in the array
     """
 
-    mut_to_del = []
-
-    for idx in range(0, len(frequency_array[0])):
-        check_all = []
-        for frequency_list in frequency_array:
-            check_all.append(frequency_list[idx])
-        # check if all mutation in a column are zero (happens with some weird callers)
-        if all(x == 0 for x in check_all):
-            mut_to_del.append(idx)
-        # check if frequencies are present in all columns and the maximal diff is greater than 0.5
-        # example [0.8, 0.7, 0.3] is not deleted whereas [0.8, 0.7, 0.7] is deleted
-        elif all(x > 0 for x in check_all) and max(check_all)-min(check_all) < 0.5:
-            mut_to_del.append(idx)
+    # check if all mutation in a column are zero (happens with some weird callers)
+    all_zero = (frequency_array == 0).all(axis=0)
+    # check if frequencies are present in all columns and the maximal diff is greater than 0.5
+    # example [0.8, 0.7, 0.3] is not deleted whereas [0.8, 0.7, 0.7] is deleted
+    all_present = (frequency_array > 0).all(axis=0)
+    low_diff = frequency_array.max(axis=0) - frequency_array.min(axis=0) < 0.5
+    mut_to_del = np.where(all_zero | (all_present & low_diff))[0]
 
     for idx in sorted(mut_to_del, reverse=True):
         del unique_mutations[idx]
+        del positions[idx]
 
     return np.delete(frequency_array, mut_to_del, axis=1)
 
 
-def delete_n_mutations(frequency_array, unique_mutations, min_mut):
+def delete_n_mutations(frequency_array, unique_mutations, positions, min_mut):
     """
     delete mutations that are not present in more than n samples
     """
-    mut_to_del = []
-
-    for idx in range(0, len(frequency_array[0])):
-        n_mutations = 0
-        for frequency_list in frequency_array:
-            if frequency_list[idx] > 0:
-                n_mutations += 1
-        # check if min_mut was reached and if not mark as to delete
-        if n_mutations <= min_mut:
-            mut_to_del.append(idx)
+    # count the samples with the mutation and check if min_mut was reached
+    n_mutations = (frequency_array > 0).sum(axis=0)
+    mut_to_del = np.where(n_mutations <= min_mut)[0]
     # delete the mutations that are found only min_mut times in all samples
     for idx in sorted(mut_to_del, reverse=True):
         del unique_mutations[idx]
+        del positions[idx]
 
     return np.delete(frequency_array, mut_to_del, axis=1)
 
 
-def zoom_to_genomic_regions(unique_mutations, start_stop):
+def zoom_to_genomic_regions(unique_mutations, positions, start_stop):
     """
     restrict the displayed mutations to a user defined genomic range
     """
-    zoomed_unique = []
-
-    for mutation in unique_mutations:
-        if start_stop[0] <= int(mutation.split("_")[0]) <= start_stop[1]:
-            zoomed_unique.append(mutation)
+    positions = np.asarray(positions)
+    in_range = np.where((start_stop[0] <= positions) & (positions <= start_stop[1]))[0]
 
-    return zoomed_unique
+    return [unique_mutations[idx] for idx in in_range], positions[in_range].tolist()
 
 
 def parse_gff3(file, reference):
@@ -343,7 +442,7 @@ def get_genome_end(gff3_dict):
     return genome_end
 
 
-def create_track_dict(unique_mutations, gff3_info, annotation_type):
+def create_track_dict(positions, gff3_info, annotation_type):
     """
     create a dictionary of the genes that have mutations and assess in which
     track these genes should go in case they overlap
@@ -351,24 +450,27 @@ def create_track_dict(unique_mutations, gff3_info, annotation_type):
 
     # find genes that have a mutation
     genes_with_mutations = set()
-    for mutation in unique_mutations:
-        # get the mutation from string
-        mutation = int(mutation.split("_")[0])
-        for type in annotation_type:
-            if type not in gff3_info.keys():
-                continue
-            for annotation in gff3_info[type]:
-                if mutation in range(gff3_info[type][annotation]["start"], gff3_info[type][annotation]["stop"]):
-                    if "Name" in gff3_info[type][annotation].keys():
-                        attribute_name = gff3_info[type][annotation]["Name"]
-                    else:
-                        attribute_name = annotation
-                    genes_with_mutations.add(
-                        (attribute_name,
-                         gff3_info[type][annotation]["start"],
-                         gff3_info[type][annotation]["stop"],
-                         gff3_info[type][annotation]["strand"])
-                    )
+    # sorted positions to count the mutations of all annotations by bisection
+    positions = np.sort(np.asarray(positions))
+    for type in annotation_type:
+        if type not in gff3_info.keys():
+            continue
+        annotations = list(gff3_info[type].keys())
+        starts = np.array([gff3_info[type][annotation]["start"] for annotation in annotations])
+        stops = np.array([gff3_info[type][annotation]["stop"] for annotation in annotations])
+        # annotation has a mutation in range(start, stop)
+        has_mutation = np.searchsorted(positions, starts) < np.searchsorted(positions, stops)
+        for annotation in [a for a, hit in zip(annotations, has_mutation) if hit]:
+            if "Name" in gff3_info[type][annotation].keys():
+                attribute_name = gff3_info[type][annotation]["Name"]
+            else:
+                attribute_name = annotation
+            genes_with_mutations.add(
+                (attribute_name,
+                 gff3_info[type][annotation]["start"],
+                 gff3_info[type][annotation]["stop"],
+                 gff3_info[type][annotation]["strand"])
+            )
     if not genes_with_mutations:
         print("\033[31m\033[1mWARNING:\033[0m either the annotation types were not found in gff3 or the mutations are not within genes.")
         return {}, 0
@@ -53,10 +53,9 @@ def create_genome_vis(ax, genome_y_location, n_mutations, unique_mutations, star
     x_start = 0
     length = stop - start
     for mutation in unique_mutations:
-        mutation_attributes = mutation.split("_")
-        mutation_color = mutation_type_colors[mutation_attributes[3]]
-        mutation_set.add(mutation_attributes[3])
-        mutation_x_location = n_mutations/length*(int(mutation_attributes[0])-start)
+        mutation_color = mutation_type_colors[mutation[3]]
+        mutation_set.add(mutation[3])
+        mutation_x_location = n_mutations/length*(mutation[0]-start)
         # create mutation lines
         plt.vlines(x=mutation_x_location, ymin=y_min, ymax=y_max, color=mutation_color)
         # create polygon
@@ -77,9 +76,8 @@ def create_scores_vis(ax, genome_y_location, n_mutations, n_tracks, unique_mutat
 
     # create list of tuples [(nt pos, score)]
     for mutation in unique_mutations:
-        mutation_attributes = mutation.split("_")
-        if not np.isnan(float(mutation_attributes[5])):
-            score_set.append((int(mutation_attributes[0]), float(mutation_attributes[5])))
+        if not np.isnan(float(mutation[5])):
+            score_set.append((mutation[0], float(mutation[5])))
     # check if there is something to plot
     if score_set:
         # define normalization multiplier for the height of the score v lines
@@ -210,8 +208,7 @@ def create_axis(ax, n_mutations, min_y_location, n_samples, file_names, start, s
     # set second x axis for mut pos
     secxtick_labels = []
     secxtick_ticks = []
-    for idx, mut in enumerate(unique_mutations):
-        mutation = mut.split("_")
+    for idx, mutation in enumerate(unique_mutations):
         secxtick_labels.append(f"{mutation[1]}{mutation[0]}{mutation[2]}")
         secxtick_ticks.append(idx+0.5)
     secax = ax.secondary_xaxis("top")